@@ -14,7 +14,8 @@ from typing import Optional
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
-from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.exceptions import ConfigEntryNotReady, HomeAssistantError
+from homeassistant.helpers.device_registry import DeviceInfo
 
 from .const import DOMAIN, CONF_HOST, CONF_PORT
 from .coordinator import ServoCamCoordinator
@@ -34,7 +35,15 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     host = entry.data[CONF_HOST]
     port = entry.data[CONF_PORT]
 
-    coordinator = ServoCamCoordinator(hass, host, port)
+    # One DeviceInfo shared by every entity of this camera
+    device_info = DeviceInfo(
+        identifiers={(DOMAIN, entry.entry_id)},
+        name="Servo Security Camera",
+        manufacturer="Custom",
+        model="Servo Cam v1.0",
+        sw_version="1.0.0",
+    )
+    coordinator = ServoCamCoordinator(hass, host, port, device_info)
 
     # Test connection
     try:
@@ -70,11 +79,16 @@ async def async_setup_services(hass: HomeAssistant) -> None:
     import voluptuous as vol
     from homeassistant.helpers import config_validation as cv
 
+    def get_coordinator() -> ServoCamCoordinator:
+        """Return the coordinator for the first entry (works with single camera)."""
+        coordinator = next(iter(hass.data.get(DOMAIN, {}).values()), None)
+        if coordinator is None:
+            raise HomeAssistantError("No Servo Camera is configured")
+        return coordinator
+
     async def handle_move_servo(call):
         """Handle move_servo service call."""
-        # Get coordinator for the first entry (works with single camera)
-        entry_id = next(iter(hass.data[DOMAIN]))
-        coordinator: ServoCamCoordinator = hass.data[DOMAIN][entry_id]
+        coordinator = get_coordinator()
 
         pan = call.data.get("pan")
         tilt = call.data.get("tilt")
@@ -82,30 +96,26 @@ async def async_setup_services(hass: HomeAssistant) -> None:
 
     async def handle_preset_position(call):
         """Handle preset_position service call."""
-        entry_id = next(iter(hass.data[DOMAIN]))
-        coordinator: ServoCamCoordinator = hass.data[DOMAIN][entry_id]
+        coordinator = get_coordinator()
 
         position = call.data.get("position")
         await coordinator.async_preset_position(position)
 
     async def handle_start_patrol(call):
         """Handle start_patrol service call."""
-        entry_id = next(iter(hass.data[DOMAIN]))
-        coordinator: ServoCamCoordinator = hass.data[DOMAIN][entry_id]
+        coordinator = get_coordinator()
 
         await coordinator.async_start_patrol()
 
     async def handle_stop_patrol(call):
         """Handle stop_patrol service call."""
-        entry_id = next(iter(hass.data[DOMAIN]))
-        coordinator: ServoCamCoordinator = hass.data[DOMAIN][entry_id]
+        coordinator = get_coordinator()
 
         await coordinator.async_stop_patrol()
 
     async def handle_center_camera(call):
         """Handle center_camera service call."""
-        entry_id = next(iter(hass.data[DOMAIN]))
-        coordinator: ServoCamCoordinator = hass.data[DOMAIN][entry_id]
+        coordinator = get_coordinator()
 
         await coordinator.async_center_camera()
 
@@ -9,10 +9,10 @@ from homeassistant.components.binary_sensor import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
 from .coordinator import ServoCamCoordinator
+from .entity import ServoCamEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -36,25 +36,11 @@ async def async_setup_entry(
     async_add_entities(sensors)
 
 
-class ServoCamBinarySensorBase(CoordinatorEntity[ServoCamCoordinator], BinarySensorEntity):
+class ServoCamBinarySensorBase(ServoCamEntity, BinarySensorEntity):
     """Base class for Servo Camera binary sensors."""
 
-    _attr_has_entity_name = True
-
-    def __init__(
-        self,
-        coordinator: ServoCamCoordinator,
-        entry: ConfigEntry,
-        sensor_type: str,
-    ) -> None:
-        """Initialize the binary sensor."""
-        super().__init__(coordinator)
-
-        self._attr_unique_id = f"{entry.entry_id}_{sensor_type}"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry.entry_id)},
-            "name": "Servo Security Camera",
-        }
+    _state_attr = "_attr_is_on"
+    _data_default = False
 
 
 class MonitoringActiveBinarySensor(ServoCamBinarySensorBase):
@@ -63,16 +49,12 @@ class MonitoringActiveBinarySensor(ServoCamBinarySensorBase):
     _attr_name = "Monitoring active"
     _attr_device_class = BinarySensorDeviceClass.RUNNING
     _attr_icon = "mdi:eye"
+    _data_key = "monitoring_active"
 
     def __init__(self, coordinator: ServoCamCoordinator, entry: ConfigEntry) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, entry, "monitoring_active")
 
-    @property
-    def is_on(self) -> bool:
-        """Return true if monitoring is active."""
-        return self.coordinator.data.get("monitoring_active", False)
-
 
 class PatrolActiveBinarySensor(ServoCamBinarySensorBase):
     """Binary sensor for patrol active state."""
@@ -85,14 +67,11 @@ class PatrolActiveBinarySensor(ServoCamBinarySensorBase):
         """Initialize the sensor."""
         super().__init__(coordinator, entry, "patrol_active")
 
-    @property
-    def is_on(self) -> bool:
+    def _compute_value(self) -> bool:
         """Return true if patrol is active."""
         # Patrol is active if monitoring is active and PATROL_ENABLED
-        return (
-            self.coordinator.data.get("monitoring_active", False)
-            and self.coordinator.data.get("patrol_enabled", False)
-        )
+        data = self.coordinator.data
+        return data.get("monitoring_active", False) and data.get("patrol_enabled", False)
 
 
 class ServoConnectedBinarySensor(ServoCamBinarySensorBase):
@@ -101,16 +80,12 @@ class ServoConnectedBinarySensor(ServoCamBinarySensorBase):
     _attr_name = "Servo connected"
     _attr_device_class = BinarySensorDeviceClass.CONNECTIVITY
     _attr_icon = "mdi:connection"
+    _data_key = "servo_connected"
 
     def __init__(self, coordinator: ServoCamCoordinator, entry: ConfigEntry) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, entry, "servo_connected")
 
-    @property
-    def is_on(self) -> bool:
-        """Return true if servo is connected."""
-        return self.coordinator.data.get("servo_connected", False)
-
 
 class CameraActiveBinarySensor(ServoCamBinarySensorBase):
     """Binary sensor for camera active state."""
@@ -118,16 +93,12 @@ class CameraActiveBinarySensor(ServoCamBinarySensorBase):
     _attr_name = "Camera active"
     _attr_device_class = BinarySensorDeviceClass.RUNNING
     _attr_icon = "mdi:camera"
+    _data_key = "camera_active"
 
     def __init__(self, coordinator: ServoCamCoordinator, entry: ConfigEntry) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, entry, "camera_active")
 
-    @property
-    def is_on(self) -> bool:
-        """Return true if camera is active."""
-        return self.coordinator.data.get("camera_active", False)
-
 
 class MotionDetectedBinarySensor(ServoCamBinarySensorBase):
     """Binary sensor for motion detection state."""
@@ -140,23 +111,15 @@ class MotionDetectedBinarySensor(ServoCamBinarySensorBase):
         """Initialize the sensor."""
         super().__init__(coordinator, entry, "motion_detected")
 
-    @property
-    def is_on(self) -> bool:
+    def _compute_value(self) -> bool:
         """Return true if motion is currently detected."""
-        # Check recent motion within last 5 seconds
-        motion_history = self.coordinator.data.get("recent_motions", [])
-        if not motion_history:
-            return False
-
-        # Motion is "active" if detected in last update cycle
-        return len(motion_history) > 0
+        # Motion is "active" if any was reported in the last update cycle
+        return bool(self.coordinator.data.get("recent_motions"))
 
-    @property
-    def extra_state_attributes(self) -> dict:
+    def _compute_extra_state_attributes(self) -> dict:
         """Return additional attributes."""
-        motion_history = self.coordinator.data.get("recent_motions", [])
-        if motion_history:
-            last_motion = motion_history[-1]
+        last_motion = self.coordinator.last_motion
+        if last_motion:
             return {
                 "classification": last_motion.get("classification"),
                 "threat_level": last_motion.get("threat_level"),
@@ -4,7 +4,7 @@ from typing import Optional
 
 from homeassistant.components.camera import Camera, CameraEntityFeature
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -42,36 +42,14 @@ class ServoCameraEntity(CoordinatorEntity[ServoCamCoordinator], Camera):
         Camera.__init__(self)
 
         self._attr_unique_id = f"{entry.entry_id}_camera"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry.entry_id)},
-            "name": "Servo Security Camera",
-            "manufacturer": "Custom",
-            "model": "Servo Cam v1.0",
-            "sw_version": "1.0.0",
-        }
+        self._attr_device_info = coordinator.device_info
 
         # Motion detection is always enabled (handled by the system)
         self._motion_detection_enabled = True
+        self._attr_extra_state_attributes = self._build_state_attributes()
 
-    @property
-    def is_on(self) -> bool:
-        """Return true if camera is on (camera is active)."""
-        return self.coordinator.data.get("camera_active", False)
-
-    @property
-    def motion_detection_enabled(self) -> bool:
-        """Return the camera motion detection status."""
-        return self._motion_detection_enabled
-
-    @property
-    def is_streaming(self) -> bool:
-        """Return true if currently streaming."""
-        # Streaming is available when monitoring is active
-        return self.coordinator.data.get("monitoring_active", False)
-
-    @property
-    def extra_state_attributes(self) -> dict:
-        """Return additional state attributes."""
+    def _build_state_attributes(self) -> dict:
+        """Return additional state attributes for the current coordinator data."""
         data = self.coordinator.data
         return {
             ATTR_PAN_ANGLE: data.get("current_pan", 0),
@@ -92,6 +70,28 @@ class ServoCameraEntity(CoordinatorEntity[ServoCamCoordinator], Camera):
             "patrol_positions": data.get("patrol_positions", 0),
         }
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Rebuild state attributes once per coordinator update."""
+        self._attr_extra_state_attributes = self._build_state_attributes()
+        super()._handle_coordinator_update()
+
+    @property
+    def is_on(self) -> bool:
+        """Return true if camera is on (camera is active)."""
+        return self.coordinator.data.get("camera_active", False)
+
+    @property
+    def motion_detection_enabled(self) -> bool:
+        """Return the camera motion detection status."""
+        return self._motion_detection_enabled
+
+    @property
+    def is_streaming(self) -> bool:
+        """Return true if currently streaming."""
+        # Streaming is available when monitoring is active
+        return self.coordinator.data.get("monitoring_active", False)
+
     async def async_camera_image(
         self, width: Optional[int] = None, height: Optional[int] = None
     ) -> Optional[bytes]:
@@ -9,6 +9,7 @@ import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.service_info.zeroconf import ZeroconfServiceInfo
 
 from .const import (
@@ -131,13 +132,15 @@ class ServoCamConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     async def _async_validate_connection(self, host: str, port: int) -> str | None:
         """Validate connection to the Servo Camera API."""
 
+        session = async_get_clientsession(self.hass)
         try:
-            async with asyncio.timeout(10):
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(f"http://{host}:{port}/healthz") as response:
-                        if response.status == 200:
-                            return None
-                        return "cannot_connect"
+            async with session.get(
+                f"http://{host}:{port}/healthz",
+                timeout=aiohttp.ClientTimeout(total=10),
+            ) as response:
+                if response.status == 200:
+                    return None
+                return "cannot_connect"
         except asyncio.TimeoutError:
             return "timeout_connect"
         except aiohttp.ClientError:
@@ -14,17 +14,26 @@ DEFAULT_PORT = 5000
 # Update intervals
 UPDATE_INTERVAL = 1  # seconds - frequent updates for camera status
 
-# Preset positions
+# Retries for transient API failures (failed connects, 5xx responses)
+MAX_RETRIES = 2  # extra attempts after the first request
+RETRY_BASE_DELAY = 0.2  # seconds, doubled per attempt
+RETRY_MAX_DELAY = 2.0  # seconds
+RETRY_JITTER = 0.5  # +/- fraction of the delay
+
+# Servo moves arriving within this window are coalesced into one request
+MOVE_DEBOUNCE = 0.05  # seconds
+
+# Preset positions as (pan, tilt) in degrees
 PRESET_POSITIONS = {
-    "center": {"pan": 90.0, "tilt": 165.0},
-    "left": {"pan": 30.0, "tilt": 165.0},
-    "right": {"pan": 150.0, "tilt": 165.0},
-    "up": {"pan": 90.0, "tilt": 150.0},
-    "down": {"pan": 90.0, "tilt": 180.0},
-    "top_left": {"pan": 30.0, "tilt": 150.0},
-    "top_right": {"pan": 150.0, "tilt": 150.0},
-    "bottom_left": {"pan": 30.0, "tilt": 180.0},
-    "bottom_right": {"pan": 150.0, "tilt": 180.0},
+    "center": (90.0, 165.0),
+    "left": (30.0, 165.0),
+    "right": (150.0, 165.0),
+    "up": (90.0, 150.0),
+    "down": (90.0, 180.0),
+    "top_left": (30.0, 150.0),
+    "top_right": (150.0, 150.0),
+    "bottom_left": (30.0, 180.0),
+    "bottom_right": (150.0, 180.0),
 }
 
 # Event types
@@ -1,14 +1,27 @@
 """Data update coordinator for Servo Security Camera."""
 import asyncio
+import contextlib
 import logging
+import random
 from datetime import timedelta
 from typing import Any, Optional
 
 import aiohttp
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import DOMAIN, UPDATE_INTERVAL, PRESET_POSITIONS
+from .const import (
+    DOMAIN,
+    UPDATE_INTERVAL,
+    PRESET_POSITIONS,
+    MAX_RETRIES,
+    RETRY_BASE_DELAY,
+    RETRY_MAX_DELAY,
+    RETRY_JITTER,
+    MOVE_DEBOUNCE,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -16,12 +29,20 @@ _LOGGER = logging.getLogger(__name__)
 class ServoCamCoordinator(DataUpdateCoordinator):
     """Class to manage fetching Servo Camera data from the API."""
 
-    def __init__(self, hass: HomeAssistant, host: str, port: int) -> None:
+    def __init__(
+        self, hass: HomeAssistant, host: str, port: int, device_info: DeviceInfo
+    ) -> None:
         """Initialize coordinator."""
         self.host = host
         self.port = port
+        self.device_info = device_info
         self.base_url = f"http://{host}:{port}"
-        self._session: Optional[aiohttp.ClientSession] = None
+        self._session = async_get_clientsession(hass)
+        self._timeout = aiohttp.ClientTimeout(total=10, connect=3, sock_read=10)
+        self._last_motion: Optional[dict[str, Any]] = None
+        self._pending_move: Optional[tuple[float, float]] = None
+        self._move_result: Optional[asyncio.Future[bool]] = None
+        self._move_task: Optional[asyncio.Task] = None
 
         super().__init__(
             hass,
@@ -32,36 +53,94 @@ class ServoCamCoordinator(DataUpdateCoordinator):
 
     @property
     def session(self) -> aiohttp.ClientSession:
-        """Get or create aiohttp session."""
-        if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession()
+        """Return Home Assistant's shared aiohttp session."""
         return self._session
 
+    @property
+    def last_motion(self) -> Optional[dict[str, Any]]:
+        """Return the most recent motion event, if any."""
+        return self._last_motion
+
+    def _update_derived(self, data: dict[str, Any]) -> None:
+        """Refresh values derived from a new /status payload."""
+        motions = data.get("recent_motions")
+        self._last_motion = motions[-1] if motions else None
+
+    @callback
+    def async_set_updated_data(self, data: dict[str, Any]) -> None:
+        """Replace coordinator data outside the polling cycle."""
+        self._update_derived(data)
+        super().async_set_updated_data(data)
+
+    async def _request_with_retry(
+        self, method: str, url: str, **kwargs: Any
+    ) -> aiohttp.ClientResponse:
+        """Send a request, retrying transient failures with exponential backoff.
+
+        Connection failures and 5xx responses are retried up to MAX_RETRIES
+        times after the first request; anything else (timeouts, 4xx) is
+        returned or raised straight away. The final attempt's response or
+        error is passed through unchanged so callers keep their own status
+        handling.
+
+        A POST that got a 5xx is sent again, even though the server may
+        already have applied it. This is acceptable for the mutations used
+        here (servo moves, monitoring start/stop, patrol toggles), which
+        set absolute state rather than toggling it.
+        """
+        for attempt in range(MAX_RETRIES):
+            try:
+                response = await self.session.request(
+                    method, url, timeout=self._timeout, **kwargs
+                )
+            except aiohttp.ClientConnectorError as err:
+                _LOGGER.debug("%s %s failed: %s", method, url, err)
+            else:
+                if response.status < 500:
+                    return response
+                response.release()
+
+            delay = min(RETRY_BASE_DELAY * 2**attempt, RETRY_MAX_DELAY)
+            delay *= 1 + random.uniform(-RETRY_JITTER, RETRY_JITTER)
+            await asyncio.sleep(delay)
+
+        return await self.session.request(method, url, timeout=self._timeout, **kwargs)
+
     async def async_shutdown(self) -> None:
-        """Clean up resources."""
-        if self._session and not self._session.closed:
-            await self._session.close()
+        """Cancel any queued servo move, then shut down the coordinator."""
+        if (task := self._move_task) is not None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+            # A task cancelled before its first step never runs its own cleanup
+            self._clear_pending_moves()
+        await super().async_shutdown()
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from API."""
         try:
-            async with asyncio.timeout(10):
-                async with self.session.get(f"{self.base_url}/status") as response:
-                    if response.status != 200:
-                        raise UpdateFailed(f"Error fetching data: {response.status}")
-                    return await response.json()
+            async with await self._request_with_retry(
+                "GET", f"{self.base_url}/status"
+            ) as response:
+                if response.status != 200:
+                    raise UpdateFailed(f"Error fetching data: {response.status}")
+                data = await response.json()
         except asyncio.TimeoutError as err:
             raise UpdateFailed("Timeout fetching data") from err
         except aiohttp.ClientError as err:
             raise UpdateFailed(f"Error communicating with API: {err}") from err
 
+        self._update_derived(data)
+        return data
+
     async def async_get_snapshot(self) -> Optional[bytes]:
         """Get current camera snapshot."""
         try:
-            async with asyncio.timeout(10):
-                async with self.session.get(f"{self.base_url}/snapshot") as response:
-                    if response.status == 200:
-                        return await response.read()
+            async with self.session.get(
+                f"{self.base_url}/snapshot", timeout=self._timeout
+            ) as response:
+                if response.status == 200:
+                    return await response.read()
         except (asyncio.TimeoutError, aiohttp.ClientError) as err:
             _LOGGER.error("Error fetching snapshot: %s", err)
         return None
@@ -70,30 +149,96 @@ class ServoCamCoordinator(DataUpdateCoordinator):
         """Get MJPEG stream URL."""
         return f"{self.base_url}/video_feed"
 
-    async def async_move_servo(self, pan: float, tilt: float) -> bool:
-        """Move servo to specific angles."""
+    async def _post_and_refresh(
+        self, path: str, json: Optional[dict] = None, *, op: str
+    ) -> bool:
+        """POST to the API and update coordinator data on success."""
         try:
-            async with asyncio.timeout(10):
-                async with self.session.post(
-                    f"{self.base_url}/servo/move",
-                    json={"pan": pan, "tilt": tilt}
-                ) as response:
-                    if response.status == 200:
+            async with await self._request_with_retry(
+                "POST", f"{self.base_url}{path}", json=json
+            ) as response:
+                if response.status == 200:
+                    if state := await self._status_from_response(response):
+                        self.async_set_updated_data({**self.data, **state})
+                    else:
                         await self.async_request_refresh()
-                        return True
-                    _LOGGER.error("Failed to move servo: %s", response.status)
+                    return True
+                _LOGGER.error("Failed to %s: %s", op, response.status)
         except (asyncio.TimeoutError, aiohttp.ClientError) as err:
-            _LOGGER.error("Error moving servo: %s", err)
+            _LOGGER.error("Failed to %s: %s", op, err)
         return False
 
+    async def _status_from_response(
+        self, response: aiohttp.ClientResponse
+    ) -> Optional[dict[str, Any]]:
+        """Return the /status fields echoed back in a mutation response, if any."""
+        if not self.data:
+            return None
+        try:
+            body = await response.json()
+        except (aiohttp.ContentTypeError, ValueError):
+            return None
+        if not isinstance(body, dict):
+            return None
+        return {key: value for key, value in body.items() if key in self.data}
+
+    async def async_move_servo(self, pan: float, tilt: float) -> bool:
+        """Move servo to specific angles.
+
+        Calls arriving within MOVE_DEBOUNCE of the first pending move are
+        coalesced: only the latest target is sent, and every caller gets the
+        result of that send. A caller whose target was replaced by a newer
+        one therefore still gets True when the newer move succeeds. Sends
+        never overlap, so the newest target is always the last one to reach
+        the camera.
+        """
+        self._pending_move = (pan, tilt)
+        if self._move_result is None:
+            self._move_result = self.hass.loop.create_future()
+        result = self._move_result
+        if self._move_task is None:
+            self._move_task = self.hass.async_create_task(self._async_flush_moves())
+        return await asyncio.shield(result)
+
+    async def _async_flush_moves(self) -> None:
+        """Send pending servo moves one at a time until none are left."""
+        result: Optional[asyncio.Future[bool]] = None
+        try:
+            while self._pending_move is not None:
+                await asyncio.sleep(MOVE_DEBOUNCE)
+                pan, tilt = self._pending_move
+                result = self._move_result
+                self._pending_move = None
+                self._move_result = None
+                try:
+                    ok = await self._post_and_refresh(
+                        "/servo/move", {"pan": pan, "tilt": tilt}, op="move servo"
+                    )
+                except Exception as err:  # pylint: disable=broad-except
+                    result.set_exception(err)
+                else:
+                    result.set_result(ok)
+        finally:
+            self._clear_pending_moves(result)
+
+    def _clear_pending_moves(self, *in_flight: Optional[asyncio.Future[bool]]) -> None:
+        """Drop queued servo moves and cancel any caller still waiting on one."""
+        for result in (*in_flight, self._move_result):
+            if result is not None and not result.done():
+                result.cancel()
+        self._move_task = None
+        self._pending_move = None
+        self._move_result = None
+
     async def async_preset_position(self, position: str) -> bool:
         """Move to preset position."""
-        if position not in PRESET_POSITIONS:
+        try:
+            pan, tilt = PRESET_POSITIONS[position]
+        except KeyError:
             _LOGGER.error("Unknown preset position: %s", position)
             return False
 
-        preset = PRESET_POSITIONS[position]
-        return await self.async_move_servo(preset["pan"], preset["tilt"])
+        return await self.async_move_servo(pan, tilt)
 
     async def async_center_camera(self) -> bool:
         """Center the camera."""
@@ -101,59 +246,32 @@ class ServoCamCoordinator(DataUpdateCoordinator):
 
     async def async_start_monitoring(self) -> bool:
         """Start monitoring mode."""
-        try:
-            async with asyncio.timeout(10):
-                async with self.session.post(f"{self.base_url}/monitoring/start") as response:
-                    if response.status == 200:
-                        await self.async_request_refresh()
-                        return True
-        except (asyncio.TimeoutError, aiohttp.ClientError) as err:
-            _LOGGER.error("Error starting monitoring: %s", err)
-        return False
+        return await self._post_and_refresh("/monitoring/start", op="start monitoring")
 
     async def async_stop_monitoring(self) -> bool:
         """Stop monitoring mode."""
-        try:
-            async with asyncio.timeout(10):
-                async with self.session.post(f"{self.base_url}/monitoring/stop") as response:
-                    if response.status == 200:
-                        await self.async_request_refresh()
-                        return True
-        except (asyncio.TimeoutError, aiohttp.ClientError) as err:
-            _LOGGER.error("Error stopping monitoring: %s", err)
-        return False
+        return await self._post_and_refresh("/monitoring/stop", op="stop monitoring")
 
     async def async_start_patrol(self) -> bool:
         """Start patrol mode."""
-        try:
-            async with asyncio.timeout(10):
-                async with self.session.post(f"{self.base_url}/config", json={"PATROL_ENABLED": True}) as response:
-                    if response.status == 200:
-                        await self.async_request_refresh()
-                        return True
-        except (asyncio.TimeoutError, aiohttp.ClientError) as err:
-            _LOGGER.error("Error starting patrol: %s", err)
-        return False
+        return await self._post_and_refresh(
+            "/config", {"PATROL_ENABLED": True}, op="start patrol"
+        )
 
     async def async_stop_patrol(self) -> bool:
         """Stop patrol mode."""
-        try:
-            async with asyncio.timeout(10):
-                async with self.session.post(f"{self.base_url}/config", json={"PATROL_ENABLED": False}) as response:
-                    if response.status == 200:
-                        await self.async_request_refresh()
-                        return True
-        except (asyncio.TimeoutError, aiohttp.ClientError) as err:
-            _LOGGER.error("Error stopping patrol: %s", err)
-        return False
+        return await self._post_and_refresh(
+            "/config", {"PATROL_ENABLED": False}, op="stop patrol"
+        )
 
     async def async_get_config(self) -> Optional[dict]:
         """Get current configuration."""
         try:
-            async with asyncio.timeout(10):
-                async with self.session.get(f"{self.base_url}/config") as response:
-                    if response.status == 200:
-                        return await response.json()
+            async with self.session.get(
+                f"{self.base_url}/config", timeout=self._timeout
+            ) as response:
+                if response.status == 200:
+                    return await response.json()
         except (asyncio.TimeoutError, aiohttp.ClientError) as err:
             _LOGGER.error("Error fetching config: %s", err)
         return None
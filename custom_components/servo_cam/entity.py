@@ -0,0 +1,66 @@
+"""Base entity for Servo Security Camera integration."""
+import sys
+from typing import Any, Optional
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import callback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .coordinator import ServoCamCoordinator
+
+
+class ServoCamEntity(CoordinatorEntity[ServoCamCoordinator]):
+    """Base class for Servo Camera sensors, binary sensors and switches.
+
+    State is computed once per coordinator update and cached in the
+    platform's ``_attr_*`` field; state is only written when it changed.
+    """
+
+    _attr_has_entity_name = True
+
+    # Platform attribute holding the entity state, e.g. "_attr_native_value"
+    _state_attr: str
+    # Key and fallback for entities that mirror a single /status field
+    _data_key: str
+    _data_default: Any = None
+
+    def __init__(
+        self,
+        coordinator: ServoCamCoordinator,
+        entry: ConfigEntry,
+        entity_type: str,
+    ) -> None:
+        """Initialize the entity."""
+        super().__init__(coordinator)
+
+        self._attr_unique_id = sys.intern(f"{entry.entry_id}_{entity_type}")
+        self._attr_device_info = coordinator.device_info
+        self._last_written: Optional[tuple] = None
+        self._update_state()
+
+    def _compute_value(self) -> Any:
+        """Return the entity state from the current coordinator data."""
+        return self.coordinator.data.get(self._data_key, self._data_default)
+
+    def _compute_extra_state_attributes(self) -> Optional[dict]:
+        """Return additional attributes from the current coordinator data."""
+        return None
+
+    def _update_state(self) -> None:
+        """Cache state and attributes for the current coordinator data."""
+        setattr(self, self._state_attr, self._compute_value())
+        self._attr_extra_state_attributes = self._compute_extra_state_attributes()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Recompute the state and write it only if anything changed."""
+        self._update_state()
+        written = (
+            self.available,
+            getattr(self, self._state_attr),
+            self._attr_extra_state_attributes,
+        )
+        if written == self._last_written:
+            return
+        self._last_written = written
+        self.async_write_ha_state()
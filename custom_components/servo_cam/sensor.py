@@ -11,7 +11,6 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import DEGREE, UnitOfTime
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     DOMAIN,
@@ -23,6 +22,7 @@ from .const import (
     ATTR_TILT_ANGLE,
 )
 from .coordinator import ServoCamCoordinator
+from .entity import ServoCamEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -50,25 +50,10 @@ async def async_setup_entry(
     async_add_entities(sensors)
 
 
-class ServoCamSensorBase(CoordinatorEntity[ServoCamCoordinator], SensorEntity):
+class ServoCamSensorBase(ServoCamEntity, SensorEntity):
     """Base class for Servo Camera sensors."""
 
-    _attr_has_entity_name = True
-
-    def __init__(
-        self,
-        coordinator: ServoCamCoordinator,
-        entry: ConfigEntry,
-        sensor_type: str,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator)
-
-        self._attr_unique_id = f"{entry.entry_id}_{sensor_type}"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry.entry_id)},
-            "name": "Servo Security Camera",
-        }
+    _state_attr = "_attr_native_value"
 
 
 class PanAngleSensor(ServoCamSensorBase):
@@ -78,16 +63,12 @@ class PanAngleSensor(ServoCamSensorBase):
     _attr_native_unit_of_measurement = DEGREE
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_icon = "mdi:pan"
+    _data_key = "current_pan"
 
     def __init__(self, coordinator: ServoCamCoordinator, entry: ConfigEntry) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, entry, "pan_angle")
 
-    @property
-    def native_value(self) -> Optional[float]:
-        """Return the state of the sensor."""
-        return self.coordinator.data.get("current_pan")
-
 
 class TiltAngleSensor(ServoCamSensorBase):
     """Sensor for tilt angle."""
@@ -96,16 +77,12 @@ class TiltAngleSensor(ServoCamSensorBase):
     _attr_native_unit_of_measurement = DEGREE
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_icon = "mdi:angle-acute"
+    _data_key = "current_tilt"
 
     def __init__(self, coordinator: ServoCamCoordinator, entry: ConfigEntry) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, entry, "tilt_angle")
 
-    @property
-    def native_value(self) -> Optional[float]:
-        """Return the state of the sensor."""
-        return self.coordinator.data.get("current_tilt")
-
 
 class MotionCountSensor(ServoCamSensorBase):
     """Sensor for motion detection count."""
@@ -113,16 +90,13 @@ class MotionCountSensor(ServoCamSensorBase):
     _attr_name = "Motion detections"
     _attr_state_class = SensorStateClass.TOTAL_INCREASING
     _attr_icon = "mdi:motion-sensor"
+    _data_key = "motion_count"
+    _data_default = 0
 
     def __init__(self, coordinator: ServoCamCoordinator, entry: ConfigEntry) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, entry, "motion_count")
 
-    @property
-    def native_value(self) -> Optional[int]:
-        """Return the state of the sensor."""
-        return self.coordinator.data.get("motion_count", 0)
-
 
 class WebhookCountSensor(ServoCamSensorBase):
     """Sensor for webhook/alert count."""
@@ -130,16 +104,13 @@ class WebhookCountSensor(ServoCamSensorBase):
     _attr_name = "Alerts sent"
     _attr_state_class = SensorStateClass.TOTAL_INCREASING
     _attr_icon = "mdi:bell-alert"
+    _data_key = "webhooks_sent"
+    _data_default = 0
 
     def __init__(self, coordinator: ServoCamCoordinator, entry: ConfigEntry) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, entry, "webhook_count")
 
-    @property
-    def native_value(self) -> Optional[int]:
-        """Return the state of the sensor."""
-        return self.coordinator.data.get("webhooks_sent", 0)
-
 
 class SessionDurationSensor(ServoCamSensorBase):
     """Sensor for session duration."""
@@ -149,16 +120,13 @@ class SessionDurationSensor(ServoCamSensorBase):
     _attr_device_class = SensorDeviceClass.DURATION
     _attr_state_class = SensorStateClass.TOTAL_INCREASING
     _attr_icon = "mdi:timer"
+    _data_key = "session_duration"
+    _data_default = 0
 
     def __init__(self, coordinator: ServoCamCoordinator, entry: ConfigEntry) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, entry, "session_duration")
 
-    @property
-    def native_value(self) -> Optional[float]:
-        """Return the state of the sensor."""
-        return self.coordinator.data.get("session_duration", 0)
-
 
 class FrameCountSensor(ServoCamSensorBase):
     """Sensor for frame count."""
@@ -166,16 +134,13 @@ class FrameCountSensor(ServoCamSensorBase):
     _attr_name = "Frames processed"
     _attr_state_class = SensorStateClass.TOTAL_INCREASING
     _attr_icon = "mdi:camera-burst"
+    _data_key = "frame_count"
+    _data_default = 0
 
     def __init__(self, coordinator: ServoCamCoordinator, entry: ConfigEntry) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, entry, "frame_count")
 
-    @property
-    def native_value(self) -> Optional[int]:
-        """Return the state of the sensor."""
-        return self.coordinator.data.get("frame_count", 0)
-
 
 class LastMotionClassificationSensor(ServoCamSensorBase):
     """Sensor for last motion classification."""
@@ -187,22 +152,17 @@ class LastMotionClassificationSensor(ServoCamSensorBase):
         """Initialize the sensor."""
         super().__init__(coordinator, entry, "last_motion_classification")
 
-    @property
-    def native_value(self) -> Optional[str]:
+    def _compute_value(self) -> Optional[str]:
         """Return the state of the sensor."""
-        # Get from last motion history
-        motion_history = self.coordinator.data.get("recent_motions", [])
-        if motion_history:
-            last_motion = motion_history[-1]
+        last_motion = self.coordinator.last_motion
+        if last_motion:
             return last_motion.get("classification", "unknown")
         return None
 
-    @property
-    def extra_state_attributes(self) -> dict:
+    def _compute_extra_state_attributes(self) -> dict:
         """Return additional attributes."""
-        motion_history = self.coordinator.data.get("recent_motions", [])
-        if motion_history:
-            last_motion = motion_history[-1]
+        last_motion = self.coordinator.last_motion
+        if last_motion:
             return {
                 ATTR_MOTION_CONFIDENCE: last_motion.get("confidence"),
                 ATTR_MOTION_SPEED: last_motion.get("speed"),
@@ -222,12 +182,10 @@ class LastMotionThreatSensor(ServoCamSensorBase):
         """Initialize the sensor."""
         super().__init__(coordinator, entry, "last_motion_threat")
 
-    @property
-    def native_value(self) -> Optional[float]:
+    def _compute_value(self) -> Optional[float]:
         """Return the state of the sensor."""
-        motion_history = self.coordinator.data.get("recent_motions", [])
-        if motion_history:
-            last_motion = motion_history[-1]
+        last_motion = self.coordinator.last_motion
+        if last_motion:
             return last_motion.get("threat_level")
         return None
 
@@ -238,12 +196,9 @@ class WebhookQueueSensor(ServoCamSensorBase):
     _attr_name = "Alert queue size"
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_icon = "mdi:buffer"
+    _data_key = "webhook_queue_size"
+    _data_default = 0
 
     def __init__(self, coordinator: ServoCamCoordinator, entry: ConfigEntry) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, entry, "webhook_queue")
-
-    @property
-    def native_value(self) -> Optional[int]:
-        """Return the state of the sensor."""
-        return self.coordinator.data.get("webhook_queue_size", 0)
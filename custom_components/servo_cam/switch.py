@@ -6,10 +6,10 @@ from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
 from .coordinator import ServoCamCoordinator
+from .entity import ServoCamEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -30,25 +30,11 @@ async def async_setup_entry(
     async_add_entities(switches)
 
 
-class ServoCamSwitchBase(CoordinatorEntity[ServoCamCoordinator], SwitchEntity):
+class ServoCamSwitchBase(ServoCamEntity, SwitchEntity):
     """Base class for Servo Camera switches."""
 
-    _attr_has_entity_name = True
-
-    def __init__(
-        self,
-        coordinator: ServoCamCoordinator,
-        entry: ConfigEntry,
-        switch_type: str,
-    ) -> None:
-        """Initialize the switch."""
-        super().__init__(coordinator)
-
-        self._attr_unique_id = f"{entry.entry_id}_{switch_type}"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry.entry_id)},
-            "name": "Servo Security Camera",
-        }
+    _state_attr = "_attr_is_on"
+    _data_default = False
 
 
 class MonitoringSwitch(ServoCamSwitchBase):
@@ -56,16 +42,12 @@ class MonitoringSwitch(ServoCamSwitchBase):
 
     _attr_name = "Monitoring"
     _attr_icon = "mdi:eye"
+    _data_key = "monitoring_active"
 
     def __init__(self, coordinator: ServoCamCoordinator, entry: ConfigEntry) -> None:
         """Initialize the switch."""
         super().__init__(coordinator, entry, "monitoring")
 
-    @property
-    def is_on(self) -> bool:
-        """Return true if monitoring is on."""
-        return self.coordinator.data.get("monitoring_active", False)
-
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn on monitoring."""
         await self.coordinator.async_start_monitoring()
@@ -74,13 +56,13 @@ class MonitoringSwitch(ServoCamSwitchBase):
         """Turn off monitoring."""
         await self.coordinator.async_stop_monitoring()
 
-    @property
-    def extra_state_attributes(self) -> dict:
+    def _compute_extra_state_attributes(self) -> dict:
         """Return additional state attributes."""
+        data = self.coordinator.data
         return {
-            "motion_count": self.coordinator.data.get("motion_count", 0),
-            "session_duration": self.coordinator.data.get("session_duration", 0),
-            "webhooks_sent": self.coordinator.data.get("webhooks_sent", 0),
+            "motion_count": data.get("motion_count", 0),
+            "session_duration": data.get("session_duration", 0),
+            "webhooks_sent": data.get("webhooks_sent", 0),
         }
 
 
@@ -89,16 +71,12 @@ class PatrolSwitch(ServoCamSwitchBase):
 
     _attr_name = "Patrol mode"
     _attr_icon = "mdi:routes"
+    _data_key = "patrol_enabled"
 
     def __init__(self, coordinator: ServoCamCoordinator, entry: ConfigEntry) -> None:
         """Initialize the switch."""
         super().__init__(coordinator, entry, "patrol")
 
-    @property
-    def is_on(self) -> bool:
-        """Return true if patrol is on."""
-        return self.coordinator.data.get("patrol_enabled", False)
-
     @property
     def available(self) -> bool:
         """Return if entity is available."""
@@ -113,8 +91,7 @@ class PatrolSwitch(ServoCamSwitchBase):
         """Turn off patrol."""
         await self.coordinator.async_stop_patrol()
 
-    @property
-    def extra_state_attributes(self) -> dict:
+    def _compute_extra_state_attributes(self) -> dict:
         """Return additional state attributes."""
         return {
             "patrol_positions": self.coordinator.data.get("patrol_positions", 15),